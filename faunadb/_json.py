@@ -1,6 +1,8 @@
 from base64 import decode, urlsafe_b64decode, urlsafe_b64encode
 from datetime import date, datetime
+from enum import Enum
 from json import JSONEncoder, dumps, loads
+from uuid import UUID
 
 from iso8601 import parse_date
 
@@ -8,12 +10,32 @@ from faunadb.errors import UnexpectedError
 from faunadb.objects import FaunaTime, Native, Query, Ref, SetRef
 from faunadb.query import _Expr
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 
 def parse_json(json_string):
     """
     Parses a JSON string into python values.
     Also parses :any:`Ref`, :any:`SetRef`, :any:`FaunaTime`, and :class:`date`.
     """
+    # Every FaunaDB type is tagged by an "@"-prefixed key. orjson has no object_hook, and walking
+    # its result in python is slower than json's hook, so it is only used when there are no tags.
+    if orjson is not None:
+        marker = "@" if isinstance(json_string, str) else b"@"
+        if marker not in json_string:
+            try:
+                return orjson.loads(json_string)
+            except orjson.JSONDecodeError:
+                # orjson rejects NaN, infinities and lone surrogates, which json accepts.
+                pass
     return loads(json_string, object_hook=_parse_json_hook)
 
 
@@ -24,6 +46,36 @@ def parse_json_or_none(json_string):
         return None
 
 
+def parse_json_resource_stream(stream):
+    """
+    Incrementally parses a response body read from the file-like ``stream``,
+    keeping only its ``resource`` field. Requires ``ijson``.
+    Returns None if the body is not valid JSON.
+    """
+    try:
+        resources = list(ijson.items(stream, "resource", use_float=True))
+    except ijson.JSONError:
+        return None
+    return {"resource": _parse_json_tree(resources[0])} if resources else {}
+
+
+def _parse_json_tree(value):
+    """
+    Applies :any:`_parse_json_hook` to every object in an already decoded value,
+    innermost objects first, the same order ``object_hook`` would see them in.
+    """
+    if type(value) is dict:
+        for key, item in value.items():
+            if type(item) is dict or type(item) is list:
+                value[key] = _parse_json_tree(item)
+        return _parse_json_hook(value)
+    if type(value) is list:
+        for i, item in enumerate(value):
+            if type(item) is dict or type(item) is list:
+                value[i] = _parse_json_tree(item)
+    return value
+
+
 def _parse_json_hook(dct):
     # pylint: disable=too-many-return-statements
     """
@@ -56,8 +108,23 @@ def to_json(dct, pretty=False, sort_keys=False):
     Opposite of parse_json.
     Converts a :any`_Expr` into a request body, calling :any:`to_fauna_json`.
     """
+    if orjson is not None:
+        # Let _fauna_json_default decide on datetimes and dataclasses, as json does.
+        option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+        if pretty:
+            option |= orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
+        elif sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        # Note that orjson writes NaN and infinities as null, where json writes NaN and Infinity.
+        try:
+            return orjson.dumps(dct, default=_fauna_json_default, option=option).decode('utf-8')
+        except orjson.JSONEncodeError:
+            # orjson is stricter than json (e.g. non-string keys, integers wider than 64 bits)
+            # and does not preserve errors raised by `default`; let json handle or report those.
+            pass
     if pretty:
-        return dumps(dct, cls=_FaunaJSONEncoder, sort_keys=True, indent=2, separators=(", ", ": "))
+        return dumps(dct, cls=_FaunaJSONEncoder, sort_keys=True, indent=2, separators=(",", ": "),
+                     ensure_ascii=False)
     return dumps(dct, cls=_FaunaJSONEncoder, sort_keys=sort_keys, separators=(",", ":"))
 
 
@@ -82,19 +149,29 @@ def stream_content_to_json(buffer):
     return {"buffer": buffer,  "values": values}
 
 
+def _fauna_json_default(obj):
+    """Converts :any:`_Expr`, :any:`datetime`, :any:`date` to JSON."""
+    if isinstance(obj, _Expr):
+        return obj.to_fauna_json()
+    elif isinstance(obj, datetime):
+        return FaunaTime(obj).to_fauna_json()
+    elif isinstance(obj, date):
+        return {"@date": obj.isoformat()}
+    elif isinstance(obj, (bytes, bytearray)):
+        return {"@bytes": urlsafe_b64encode(obj).decode('utf-8')}
+    # orjson encodes these natively; encode them the same way when it is not installed.
+    elif isinstance(obj, Enum):
+        return obj.value
+    elif isinstance(obj, UUID):
+        return str(obj)
+    else:
+        raise UnexpectedError(
+            "Unserializable object {} of type {}".format(obj, type(obj)), None)
+
+
 class _FaunaJSONEncoder(JSONEncoder):
     """Converts :any:`_Expr`, :any:`datetime`, :any:`date` to JSON."""
     # pylint: disable=method-hidden,arguments-differ
 
     def default(self, obj):
-        if isinstance(obj, _Expr):
-            return obj.to_fauna_json()
-        elif isinstance(obj, datetime):
-            return FaunaTime(obj).to_fauna_json()
-        elif isinstance(obj, date):
-            return {"@date": obj.isoformat()}
-        elif isinstance(obj, (bytes, bytearray)):
-            return {"@bytes": urlsafe_b64encode(obj).decode('utf-8')}
-        else:
-            raise UnexpectedError(
-                "Unserializable object {} of type {}".format(obj, type(obj)), None)
+        return _fauna_json_default(obj)
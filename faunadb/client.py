@@ -5,29 +5,60 @@ import sys
 import threading
 # pylint: disable=redefined-builtin
 from builtins import object
+from functools import lru_cache
 from time import time
 
 from requests import Request, Session, get
 from requests.adapters import HTTPAdapter
 from requests.auth import AuthBase
+from requests.exceptions import ChunkedEncodingError, ContentDecodingError
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from urllib3.exceptions import DecodeError, ProtocolError, ReadTimeoutError
 
 from faunadb import __api_version__ as api_version
 from faunadb import __version__ as pkg_version
-from faunadb._json import parse_json_or_none, to_json
+from faunadb._json import ijson, parse_json_or_none, parse_json_resource_stream, to_json
 from faunadb.errors import FaunaError, UnexpectedError, _get_or_raise
 from faunadb.query import _wrap
 from faunadb.request_result import RequestResult
 from faunadb.streams import Subscription
 
+# Only advertise Brotli when a decoder that both requests and httpx can use is installed.
+try:
+    import brotli  # pylint: disable=unused-import
+    _ACCEPT_ENCODING = "br, gzip"
+except ImportError:
+    try:
+        import brotlicffi  # pylint: disable=unused-import
+        _ACCEPT_ENCODING = "br, gzip"
+    except ImportError:
+        _ACCEPT_ENCODING = "gzip"
+
+_DEFAULT_PORTS = {"https": 443, "http": 80}
+
+# Successful responses at least this large are parsed while they are read when ijson is installed.
+# The size is taken from Content-Length, so it counts bytes on the wire: for a gzip or br encoded
+# response this is several times smaller than the JSON. Responses without a Content-Length
+# (chunked) are always buffered.
+_STREAM_PARSE_MIN_BYTES = 256 * 1024
+
+
+@lru_cache(maxsize=None)
+def _latest_pkg_version():
+    """Latest faunadb release on PyPI, looked up once per process."""
+    response = get('https://pypi.org/pypi/faunadb/json')
+    return response.json().get('info').get('version')
+
 
 class HTTPBearerAuth(AuthBase):
     """Creates a bearer base auth object"""
 
     def auth_header(self):
-        return "Bearer {}".format(self.secret)
+        return self._auth_header
 
     def __init__(self, secret):
         self.secret = secret
+        self._auth_header = "Bearer {}".format(secret)
 
     def __eq__(self, other):
         return self.secret == getattr(other, 'secret', None)
@@ -36,7 +67,7 @@ class HTTPBearerAuth(AuthBase):
         return not self == other
 
     def __call__(self, r):
-        r.headers['Authorization'] = self.auth_header()
+        r.headers['Authorization'] = self._auth_header
         return r
 
 
@@ -188,7 +219,8 @@ class FaunaClient(object):
         :param port:
           Port of the FaunaDB server.
         :param timeout:
-          Read timeout in seconds.
+          Connect and read timeout in seconds. Extended to the query timeout, when one is set
+          and longer, so the server can report a query timeout before the client gives up.
         :param observer:
           Callback that will be passed a :any:`RequestResult` after every completed request.
         :param pool_connections:
@@ -207,9 +239,15 @@ class FaunaClient(object):
                      "https" else 80) if port is None else port
 
         self.auth = HTTPBearerAuth(secret)
-        constructed_url = "%s://%s:%s" % (self.scheme, self.domain, self.port)
+        if str(self.port) == str(_DEFAULT_PORTS.get(self.scheme)):
+            host = self.domain
+        else:
+            host = "%s:%s" % (self.domain, self.port)
+        constructed_url = "%s://%s" % (self.scheme, host)
         self.base_url = self._normalize_endpoint(endpoint) if endpoint else constructed_url
+        self._url_prefix = self.base_url + "/"
         self.observer = observer
+        self.timeout = timeout
 
         self.pool_connections = pool_connections
         self.pool_maxsize = pool_maxsize
@@ -221,15 +259,18 @@ class FaunaClient(object):
 
         if ('session' not in kwargs) or ('counter' not in kwargs):
             self.session = Session()
-            self.session.mount('https://', HTTPAdapter(pool_connections=pool_connections,
-                                                       pool_maxsize=pool_maxsize))
-            self.session.mount('http://', HTTPAdapter(pool_connections=pool_connections,
-                                                      pool_maxsize=pool_maxsize))
+            # A single adapter backs both schemes so they draw from one connection pool.
+            adapter = HTTPAdapter(pool_connections=pool_connections,
+                                  pool_maxsize=pool_maxsize)
+            self.session.mount('https://', adapter)
+            self.session.mount('http://', adapter)
             self.counter = _Counter(1)
 
             self.session.headers.update({
+                "Connection": "keep-alive",
                 "Keep-Alive": "timeout=5",
-                "Accept-Encoding": "gzip",
+                "Accept": "application/json",
+                "Accept-Encoding": _ACCEPT_ENCODING,
                 "Content-Type": "application/json;charset=utf-8",
                 "X-Fauna-Driver": "python",
                 "X-FaunaDB-API-Version": api_version,
@@ -238,14 +279,12 @@ class FaunaClient(object):
             if self._query_timeout_ms is not None:
                 self.session.headers["X-Query-Timeout"] = str(
                     self._query_timeout_ms)
-            self.session.timeout = timeout
         else:
             self.session = kwargs['session']
             self.counter = kwargs['counter']
 
     def check_new_version(self):
-        response = get('https://pypi.org/pypi/faunadb/json')
-        latest_version = response.json().get('info').get('version')
+        latest_version = _latest_pkg_version()
 
         if latest_version > pkg_version:
             msg1 = "New fauna version available {} => {}".format(
@@ -350,7 +389,7 @@ class FaunaClient(object):
                                domain=self.domain,
                                scheme=self.scheme,
                                port=self.port,
-                               timeout=self.session.timeout,
+                               timeout=self.timeout,
                                observer=observer or self.observer,
                                session=self.session,
                                counter=self.counter,
@@ -381,25 +420,35 @@ class FaunaClient(object):
         if traceparent is not None and self._is_valid_traceparent(traceparent):
             headers["traceparent"] = traceparent
 
+        # Read once, so the body handling below and the notification agree on the observer.
+        observer = self.observer
+
         start_time = time()
-        response = self._perform_request(action, path, data, query, headers)
-        end_time = time()
+        response = self._perform_request(action, path, data, query, headers,
+                                         self._request_timeout(query_timeout_ms))
 
         if with_txn_time:
             if "X-Txn-Time" in response.headers:
                 new_txn_time = int(response.headers["X-Txn-Time"])
                 self.sync_last_txn_time(new_txn_time)
 
-        response_raw = response.text
-        response_content = parse_json_or_none(response_raw)
+        # Responses are sent with stream=True, so the body is only downloaded below.
+        if observer is None and self._should_stream_parse(response):
+            response_raw = None
+            response_content = self._parse_resource_stream(response)
+            end_time = time()
+        else:
+            response_raw = response.content
+            end_time = time()
+            response_content = parse_json_or_none(response_raw)
 
         request_result = RequestResult(
             action, path, query, data,
             response_raw, response_content, response.status_code, response.headers,
             start_time, end_time)
 
-        if self.observer is not None:
-            self.observer(request_result)
+        if observer is not None:
+            observer(request_result)
 
         if response_content is None:
             raise UnexpectedError("Invalid JSON.", request_result)
@@ -407,12 +456,49 @@ class FaunaClient(object):
         FaunaError.raise_for_status_code(request_result)
         return _get_or_raise(request_result, response_content, "resource")
 
-    def _perform_request(self, action, path, data, query, headers):
+    def _request_timeout(self, query_timeout_ms):
+        """Client-side timeout for a request, never shorter than its query timeout."""
+        if query_timeout_ms is None:
+            query_timeout_ms = self._query_timeout_ms
+        if self.timeout is None or query_timeout_ms is None:
+            return self.timeout
+        return max(self.timeout, query_timeout_ms / 1000.0)
+
+    def _perform_request(self, action, path, data, query, headers, timeout):
         """Performs an HTTP action."""
-        url = self.base_url + "/" + path
-        req = Request(action, url, params=query, data=to_json(
-            data), auth=self.auth, headers=headers)
-        return self.session.send(self.session.prepare_request(req))
+        url = self._url_prefix + path
+        # Send bytes: a str body may be encoded as Latin-1 by the HTTP stack.
+        body = None if data is None else to_json(data).encode("utf-8")
+        req = Request(action, url, params=query, data=body, auth=self.auth, headers=headers)
+        # Session.request would build the same Request and also merge proxy settings from the
+        # environment on every call, so prepare and send directly.
+        return self.session.send(self.session.prepare_request(req), timeout=timeout, stream=True)
+
+    def _should_stream_parse(self, response):
+        """Whether to parse a large response body as it is read instead of buffering it first.
+        Observers get the full response, so callers only ask when none is set."""
+        if ijson is None or not 200 <= response.status_code <= 299:
+            return False
+        try:
+            content_length = int(response.headers.get("Content-Length", 0))
+        except ValueError:
+            return False
+        return content_length >= _STREAM_PARSE_MIN_BYTES
+
+    def _parse_resource_stream(self, response):
+        """Parses the ``resource`` of a response while reading its body.
+        Transport errors are translated the same way requests does when it reads the body."""
+        response.raw.decode_content = True
+        try:
+            return parse_json_resource_stream(response.raw)
+        except ProtocolError as e:
+            raise ChunkedEncodingError(e)
+        except DecodeError as e:
+            raise ContentDecodingError(e)
+        except ReadTimeoutError as e:
+            raise RequestsConnectionError(e)
+        finally:
+            response.close()
 
     def _get_tags_string(self, tags_dict):
         if not isinstance(tags_dict, dict):
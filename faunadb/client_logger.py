@@ -1,3 +1,6 @@
+from logging import DEBUG, Logger
+from urllib.parse import urlencode
+
 from faunadb._json import to_json
 
 
@@ -13,11 +16,21 @@ def logger(logger_func):
     client = FaunaClient(observer=logger(log), ...)
     client.ping() # Calls `log`
 
-  :param logger_func: Callback taking a string to be logged.
+  ``logger_func`` may also be a :class:`logging.Logger`. Results are then logged at ``DEBUG``,
+  and are only formatted when the logger is enabled for that level.
+
+  :param logger_func: Callback taking a string to be logged, or a :class:`logging.Logger`.
   """
+  if isinstance(logger_func, Logger):
+    return lambda request_result: _log_debug(logger_func, request_result)
   return lambda request_result: logger_func(show_request_result(request_result))
 
 
+def _log_debug(log, request_result):
+  if log.isEnabledFor(DEBUG):
+    log.debug(show_request_result(request_result))
+
+
 def show_request_result(request_result):
   """Translates a :any:`RequestResult` to a string suitable for logging."""
   rr = request_result
@@ -26,11 +39,10 @@ def show_request_result(request_result):
 
   def _indent(s):
     """Adds extra spaces to the beginning of every newline."""
-    indent_str = "  "
-    return ("\n" + indent_str).join(s.split("\n"))
+    return s.replace("\n", "\n  ")
 
   if rr.query:
-    query_string = "?" + "&".join(("%s=%s" % (k, v) for k, v in sorted(rr.query.items())))
+    query_string = "?" + urlencode(sorted(rr.query.items()))
   else:
     query_string = ""
 
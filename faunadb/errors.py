@@ -24,25 +24,12 @@ class FaunaError(Exception):
     @staticmethod
     def raise_for_status_code(request_result):
         code = request_result.status_code
-        # pylint: disable=no-member, too-many-return-statements
         if 200 <= code <= 299:
-            pass
-        elif code == codes.bad_request:
-            raise BadRequest(request_result)
-        elif code == codes.unauthorized:
-            raise Unauthorized(request_result)
-        elif code == codes.forbidden:
-            raise PermissionDenied(request_result)
-        elif code == codes.not_found:
-            raise NotFound(request_result)
-        elif code == codes.conflict:
-            raise ContendedTransaction(request_result)
-        elif code == codes.internal_server_error:
-            raise InternalError(request_result)
-        elif code == codes.unavailable:
-            raise UnavailableError(request_result)
-        else:
+            return
+        error_class = _HTTP_ERRORS.get(code)
+        if error_class is None:
             raise UnexpectedError("Unexpected status code.", request_result)
+        raise error_class(request_result)
 
     def __init__(self, description, request_result):
         super(FaunaError, self).__init__(description)
@@ -111,6 +98,18 @@ class UnavailableError(HttpError):
     pass
 
 
+# pylint: disable=no-member
+_HTTP_ERRORS = {
+    codes.bad_request: BadRequest,
+    codes.unauthorized: Unauthorized,
+    codes.forbidden: PermissionDenied,
+    codes.not_found: NotFound,
+    codes.conflict: ContendedTransaction,
+    codes.internal_server_error: InternalError,
+    codes.unavailable: UnavailableError,
+}
+# pylint: enable=no-member
+
 # endregion
 
 class ErrorData(object):
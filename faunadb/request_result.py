@@ -18,8 +18,7 @@ class RequestResult(object):
     """URL query. ``None`` unless ``method == GET``. *Not* related to :any:`FaunaClient.query`."""
     self.request_content = request_content
     """Request data."""
-    self.response_raw = response_raw
-    """String value returned by the server."""
+    self._response_raw = response_raw
     self.response_content = response_content
     """
     Parsed value returned by the server.
@@ -35,6 +34,14 @@ class RequestResult(object):
     self.end_time = end_time
     """Time the response was received."""
 
+  @property
+  def response_raw(self):
+    """String value returned by the server. None if the body was parsed as it was read."""
+    # Responses are kept as bytes and only decoded if something asks for the text.
+    if isinstance(self._response_raw, bytes):
+      self._response_raw = self._response_raw.decode("utf-8", "replace")
+    return self._response_raw
+
   @property
   def time_taken(self):
     """``end_time - start_time``"""
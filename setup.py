@@ -27,6 +27,9 @@ tests_requires = [
 extras_require = {
     "test": tests_requires,
     "lint": ["pylint"],
+    "orjson": ["orjson"],
+    "ijson": ["ijson"],
+    "brotli": ["brotli"],
 }
 
 setup(
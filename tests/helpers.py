@@ -126,12 +126,12 @@ class _MockSession(object):
   def close(self):
     pass
 
-  def prepare_request(self, *args):
-    pass
+  def prepare_request(self, request):
+    self.last_request = request
 
-  def send(self, *args):
+  def send(self, *args, **kwargs):
     # pylint: disable=unused-argument
-    return _MockResponse(self.status_code, self.response_text, {})
+    return _MockResponse(self.status_code, self.response_text.encode("utf-8"), {})
 
 
-_MockResponse = namedtuple('MockResponse', ['status_code', 'text', 'headers'])
+_MockResponse = namedtuple('MockResponse', ['status_code', 'content', 'headers'])
@@ -3,9 +3,15 @@ import os
 import platform
 import random
 import string
+from io import BytesIO
+from unittest import skipIf
+from requests.exceptions import ChunkedEncodingError
+from requests.models import Response
+from urllib3 import HTTPResponse
+from faunadb._json import ijson, parse_json
 from faunadb.client import FaunaClient
 from faunadb.errors import UnexpectedError, BadRequest
-from tests.helpers import FaunaTestCase
+from tests.helpers import FaunaTestCase, mock_client
 from faunadb import __version__ as pkg_version, __api_version__ as api_version
 
 class ClientTest(FaunaTestCase):
@@ -30,6 +36,52 @@ class ClientTest(FaunaTestCase):
       client = FaunaClient(secret="secret", endpoint=e)
       self.assertEqual(client.ping("node"), "Scope node is OK")
 
+  def test_base_url_omits_default_port(self):
+    self.assertEqual(FaunaClient(secret="secret").base_url, "https://db.fauna.com")
+    self.assertEqual(FaunaClient(secret="secret", scheme="http").base_url, "http://db.fauna.com")
+    self.assertEqual(FaunaClient(secret="secret", port=8443).base_url, "https://db.fauna.com:8443")
+    self.assertEqual(FaunaClient(secret="secret", scheme="http", port=443).base_url, "http://db.fauna.com:443")
+
+  def test_request_body_is_utf8(self):
+    client = mock_client('{"resource": null}')
+    client.query({"name": u"caf\u00e9 \u65e5\u672c"})
+    body = client.session.last_request.data
+    self.assertIsInstance(body, bytes)
+    self.assertEqual(parse_json(body), {"object": {"name": u"caf\u00e9 \u65e5\u672c"}})
+
+  @skipIf(ijson is None, "ijson is not installed")
+  def test_truncated_streamed_response(self):
+    declared_length = str(2 * 1024 * 1024)
+    response = Response()
+    response.status_code = 200
+    response.headers["Content-Length"] = declared_length
+    response.raw = HTTPResponse(body=BytesIO(b'{"resource":[' + b'1,' * 1000),
+                                headers={"Content-Length": declared_length}, status=200,
+                                preload_content=False, enforce_content_length=True)
+    client = mock_client("")
+    client.session.send = lambda *args, **kwargs: response
+
+    self.assertRaises(ChunkedEncodingError, lambda: client.query({}))
+    self.assertTrue(response.raw.closed)
+
+  def test_request_timeout(self):
+    client = FaunaClient(secret="secret", timeout=60)
+    self.assertEqual(client._request_timeout(None), 60)
+    self.assertEqual(client._request_timeout(5000), 60)
+    self.assertEqual(client._request_timeout(90000), 90)
+
+    client = FaunaClient(secret="secret", timeout=60, query_timeout_ms=120000)
+    self.assertEqual(client._request_timeout(None), 120)
+    self.assertEqual(client._request_timeout(5000), 60)
+
+    self.assertIsNone(FaunaClient(secret="secret", timeout=None)._request_timeout(90000))
+
+  def test_malformed_content_length_is_buffered(self):
+    response = Response()
+    response.status_code = 200
+    response.headers["Content-Length"] = "not a number"
+    self.assertFalse(FaunaClient(secret="secret")._should_stream_parse(response))
+
   def test_query_timeout(self):
     client = FaunaClient(secret="secret", query_timeout_ms=5000)
     self.assertEqual(client.get_query_timeout(), 5000)
@@ -1,4 +1,5 @@
 from io import StringIO
+from logging import DEBUG, INFO, Handler, getLogger
 
 from faunadb.client_logger import logger
 from faunadb.query import create, create_collection
@@ -41,10 +42,10 @@ class ClientLoggerTest(FaunaTestCase):
     self.assertEqual(read_line(), '          "@ref": {\n')
     self.assertEqual(read_line(), '            "id": "collections"\n')
     self.assertEqual(read_line(), '          }\n')
-    self.assertEqual(read_line(), '        }, \n')
+    self.assertEqual(read_line(), '        },\n')
     self.assertEqual(read_line(), '        "id": "logging_tests"\n')
     self.assertEqual(read_line(), '      }\n')
-    self.assertEqual(read_line(), '    }, \n')
+    self.assertEqual(read_line(), '    },\n')
     self.assertEqual(read_line(), '    "params": {\n')
     self.assertEqual(read_line(), '      "object": {\n')
     self.assertEqual(read_line(), '        "data": {\n')
@@ -59,9 +60,33 @@ class ClientLoggerTest(FaunaTestCase):
     logged = self.get_logged(lambda client: client.ping('node', 250))
     self.assertEqual(logged.split('\n')[0], "Fauna GET /ping?scope=node&timeout=250")
 
+  def test_logging_logger(self):
+    log = getLogger("faunadb.tests.client_logger")
+    handler = _ListHandler()
+    log.addHandler(handler)
+    client = self.root_client.new_session_client(secret=self.server_key, observer=logger(log))
+
+    log.setLevel(INFO)
+    client.ping()
+    self.assertEqual(handler.messages, [])
+
+    log.setLevel(DEBUG)
+    client.ping()
+    self.assertEqual(len(handler.messages), 1)
+    self.assertEqual(handler.messages[0].split('\n')[0], "Fauna GET /ping")
+
   def get_logged(self, client_action):
     logged_box = []
     client = self.root_client.new_session_client(secret=self.server_key,
                                                  observer=logger(logged_box.append))
     client_action(client)
     return logged_box[0]
+
+
+class _ListHandler(Handler):
+  def __init__(self):
+    super(_ListHandler, self).__init__()
+    self.messages = []
+
+  def emit(self, record):
+    self.messages.append(record.getMessage())
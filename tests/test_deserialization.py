@@ -1,8 +1,10 @@
-from unittest import TestCase
+from io import BytesIO
+from math import isnan
+from unittest import TestCase, skipIf
 from iso8601 import parse_date
 
 from faunadb.objects import Ref, SetRef, FaunaTime, Query, Native
-from faunadb._json import parse_json
+from faunadb._json import ijson, parse_json, parse_json_resource_stream
 
 class DeserializationTest(TestCase):
 
@@ -107,5 +109,21 @@ class DeserializationTest(TestCase):
       "number": 1
     })
 
+  def test_bytes_input(self):
+    self.assertJson(b'{"ref":{"@ref":{"id":"widget","collection":{"@ref":{"id":"collections"}}}},"string":"caf\xc3\xa9"}',
+                    {"ref": Ref("widget", Native.COLLECTIONS), "string": u"caf\u00e9"})
+
+  def test_non_finite_floats(self):
+    self.assertTrue(isnan(parse_json('{"resource": NaN}')["resource"]))
+    self.assertEqual(parse_json(b'[Infinity, -Infinity]'), [float("inf"), float("-inf")])
+
+  @skipIf(ijson is None, "ijson is not installed")
+  def test_resource_stream(self):
+    stream = BytesIO(b'{"resource":{"ref":{"@ref":{"id":"widget","collection":{"@ref":{"id":"collections"}}}},"n":1.5}}')
+    self.assertEqual(parse_json_resource_stream(stream),
+                     {"resource": {"ref": Ref("widget", Native.COLLECTIONS), "n": 1.5}})
+    self.assertEqual(parse_json_resource_stream(BytesIO(b'{"resoars":1}')), {})
+    self.assertIsNone(parse_json_resource_stream(BytesIO(b'I like fine wine')))
+
   def assertJson(self, json, expected):
     self.assertEqual(parse_json(json), expected)
@@ -1,11 +1,15 @@
 import sys
+from dataclasses import dataclass
 from datetime import datetime
+from enum import Enum
+from uuid import UUID
 from unittest import TestCase
 import iso8601
 
 from faunadb import query
 from faunadb.objects import Ref, SetRef, FaunaTime, Query, Native
-from faunadb._json import to_json
+from faunadb._json import orjson, to_json
+from faunadb.errors import UnexpectedError
 
 class SerializationTest(TestCase):
 
@@ -51,6 +55,33 @@ class SerializationTest(TestCase):
     self.assertJson(Query({"api_version": "3", "lambda": "x", "expr": {"var": "x"}}),
                     expected2)
 
+  def test_non_finite_floats(self):
+    # orjson writes these as null, json as NaN and Infinity.
+    if orjson is not None:
+      self.assertJson(float("nan"), 'null')
+      self.assertJson({"x": float("inf")}, '{"x":null}')
+      self.assertJson([float("-inf"), None], '[null,null]')
+    else:
+      self.assertJson(float("nan"), 'NaN')
+      self.assertJson({"x": float("inf")}, '{"x":Infinity}')
+      self.assertJson([float("-inf"), None], '[-Infinity,null]')
+    self.assertJson({"x": None}, '{"x":null}')
+
+  def test_dataclass(self):
+    @dataclass
+    class Point:
+      x: int
+
+    self.assertRaises(UnexpectedError, lambda: to_json(Point(1)))
+
+  def test_enum_and_uuid(self):
+    class Color(Enum):
+      RED = "red"
+
+    self.assertJson({"color": Color.RED}, '{"color":"red"}')
+    self.assertJson(UUID("12345678-1234-5678-1234-567812345678"),
+                    '"12345678-1234-5678-1234-567812345678"')
+
   #region Basic forms
 
   def test_abort(self):
@@ -810,5 +841,26 @@ class SerializationTest(TestCase):
 
   #endregion
 
+  def test_pretty(self):
+    self.assertEqual(to_json({"b": [1, {}], "a": Ref("widgets", Native.COLLECTIONS),
+                              "c": u"caf\u00e9 \u65e5\u672c"}, pretty=True),
+                     '{\n'
+                     '  "a": {\n'
+                     '    "@ref": {\n'
+                     '      "collection": {\n'
+                     '        "@ref": {\n'
+                     '          "id": "collections"\n'
+                     '        }\n'
+                     '      },\n'
+                     '      "id": "widgets"\n'
+                     '    }\n'
+                     '  },\n'
+                     '  "b": [\n'
+                     '    1,\n'
+                     '    {}\n'
+                     '  ],\n'
+                     u'  "c": "caf\u00e9 \u65e5\u672c"\n'
+                     '}')
+
   def assertJson(self, obj, expected):
     self.assertEqual(to_json(obj, sort_keys=True), expected)